@@ -1,12 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
+import threading
+import uuid
+from collections import namedtuple
 
 # Try to import Google Sheets dependencies
 try:
+    import httplib2
+    import google_auth_httplib2
     from google.oauth2 import service_account
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
@@ -24,154 +28,332 @@ st.set_page_config(
 # ============ GOOGLE SHEETS SETUP ============
 USE_GOOGLE_SHEETS = GOOGLE_SHEETS_AVAILABLE and "gcp_service_account" in st.secrets
 
+# Number of submissions to buffer before appending them to the sheet in one call.
+# Buffered rows live in server memory until flushed, so keep this small.
+SHEETS_BATCH_SIZE = int(st.secrets.get("sheets_batch_size", 1))
+
+SPREADSHEET_ID = st.secrets.get("spreadsheet_id", "")
+
+# Sheet column order (Responses!A:AC)
+FIELDS = (
+    "timestamp", "name", "email", "position", "tenure", "satisfaction",
+    "role_dislikes", "executive_concerns", "council_dynamics",
+    "student_body_challenges", "achievements", "weaknesses", "skills_needed",
+    "constitution_knowledge", "support_gaps", "support_details",
+    "code_of_conduct", "financial_challenges", "financial_impact",
+    "financial_details", "academic_challenges", "academic_impact",
+    "academic_details", "support_needs", "retreat_goals", "training_topics",
+    "retreat_priorities", "previous_retreats", "additional_comments"
+)
+
+# Multiselect answers, stored in the sheet as ", "-joined strings
+LIST_FIELDS = (
+    "support_gaps", "financial_impact", "academic_impact",
+    "support_needs", "retreat_priorities"
+)
+
+# Responses are kept as compact tuples: the FIELDS in sheet order, then the
+# parsed timestamp. Use ._asdict() where a dict is needed.
+Response = namedtuple("Response", FIELDS + ("timestamp_dt",))
+
+def parse_timestamp(timestamp):
+    """Parse an ISO timestamp, returning None if it is missing or invalid"""
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+
+def as_list(value):
+    """Coerce an uploaded multiselect answer to a list of strings"""
+    if isinstance(value, str):
+        return value.split(", ") if value else []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return []
+
+def to_response(response_data):
+    """Convert a response dict (e.g. from an uploaded JSON file) to a Response"""
+    values = [as_list(response_data.get(field)) if field in LIST_FIELDS
+              else response_data.get(field, "") for field in FIELDS]
+    return Response(*values, timestamp_dt=parse_timestamp(response_data.get("timestamp")))
+
+@st.cache_resource(show_spinner=False)
+def build_sheets_service():
+    """Build the Google Sheets API service once per process"""
+    credentials = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"],
+        scopes=['https://www.googleapis.com/auth/spreadsheets']
+    )
+    # One long-lived connection, reused by every request on the cached service
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=10))
+    return build('sheets', 'v4', http=http, cache_discovery=False)
+
+@st.cache_resource
+def get_sheets_lock():
+    """Lock serializing requests on the shared service (it is not thread-safe)"""
+    return threading.Lock()
+
 def get_sheets_service():
-    """Create Google Sheets API service"""
+    """Get the cached Google Sheets API service"""
     if not USE_GOOGLE_SHEETS:
         return None
     
     try:
-        credentials = service_account.Credentials.from_service_account_info(
-            st.secrets["gcp_service_account"],
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        service = build('sheets', 'v4', credentials=credentials)
-        return service
+        return build_sheets_service()
     except Exception as e:
         st.error(f"Error connecting to Google Sheets: {e}")
         return None
 
+def response_to_row(response_data):
+    """Convert a response dict to a Google Sheets row"""
+    return [
+        response_data.get("timestamp", ""),
+        response_data.get("name", ""),
+        response_data.get("email", ""),
+        response_data.get("position", ""),
+        response_data.get("tenure", ""),
+        str(response_data.get("satisfaction", "")),
+        response_data.get("role_dislikes", ""),
+        response_data.get("executive_concerns", ""),
+        response_data.get("council_dynamics", ""),
+        response_data.get("student_body_challenges", ""),
+        response_data.get("achievements", ""),
+        response_data.get("weaknesses", ""),
+        response_data.get("skills_needed", ""),
+        response_data.get("constitution_knowledge", ""),
+        ", ".join(response_data.get("support_gaps", [])),
+        response_data.get("support_details", ""),
+        response_data.get("code_of_conduct", ""),
+        response_data.get("financial_challenges", ""),
+        ", ".join(response_data.get("financial_impact", [])),
+        response_data.get("financial_details", ""),
+        response_data.get("academic_challenges", ""),
+        ", ".join(response_data.get("academic_impact", [])),
+        response_data.get("academic_details", ""),
+        ", ".join(response_data.get("support_needs", [])),
+        response_data.get("retreat_goals", ""),
+        response_data.get("training_topics", ""),
+        ", ".join(response_data.get("retreat_priorities", [])),
+        response_data.get("previous_retreats", ""),
+        response_data.get("additional_comments", "")
+    ]
+
+@st.cache_resource
+def get_pending_rows():
+    """Rows waiting to be appended to Google Sheets, shared by all sessions"""
+    return {"rows": [], "lock": threading.Lock()}
+
+def flush_pending_rows():
+    """Append all buffered rows to Google Sheets in a single API call"""
+    if not USE_GOOGLE_SHEETS:
+        return False
+    
+    pending = get_pending_rows()
+    with pending["lock"]:
+        if not pending["rows"]:
+            return True
+        
+        try:
+            service = get_sheets_service()
+            if not service:
+                return False
+            
+            body = {'values': pending["rows"]}
+            request = service.spreadsheets().values().append(
+                spreadsheetId=SPREADSHEET_ID,
+                range='Responses!A:AC',
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                includeValuesInResponse=False,
+                responseValueRenderOption='UNFORMATTED_VALUE',
+                responseDateTimeRenderOption='SERIAL_NUMBER',
+                body=body
+            )
+            with get_sheets_lock():
+                request.execute()
+            
+            pending["rows"].clear()
+            return True
+        except Exception as e:
+            st.error(f"Error saving to Google Sheets: {e}")
+            return False
+
 def save_to_sheets(response_data):
-    """Save response to Google Sheets"""
+    """Queue a response for Google Sheets, flushing once the batch is full
+    
+    Returns "saved" once the row is in the sheet, "queued" while it waits for
+    a full batch, or None if the save failed (the row is then not kept).
+    """
+    if not USE_GOOGLE_SHEETS:
+        return None
+    
+    row = response_to_row(response_data)
+    pending = get_pending_rows()
+    with pending["lock"]:
+        pending["rows"].append(row)
+        batch_full = len(pending["rows"]) >= SHEETS_BATCH_SIZE
+    
+    if not batch_full:
+        return "queued"
+    if flush_pending_rows():
+        return "saved"
+    
+    # The submitter is asked to retry, so don't keep a copy that a later flush would duplicate
+    with pending["lock"]:
+        for i, queued in enumerate(pending["rows"]):
+            if queued is row:
+                del pending["rows"][i]
+                return None
+    # Another session's flush wrote it in the meantime
+    return "saved"
+
+def bulk_save_to_sheets(rows):
+    """Append many rows to Google Sheets in a single API call"""
     if not USE_GOOGLE_SHEETS:
         return False
+    if not rows:
+        return True
     
     try:
         service = get_sheets_service()
         if not service:
             return False
         
-        spreadsheet_id = st.secrets["spreadsheet_id"]
-        
-        # Convert response to row format
-        row = [
-            response_data.get("timestamp", ""),
-            response_data.get("name", ""),
-            response_data.get("email", ""),
-            response_data.get("position", ""),
-            response_data.get("tenure", ""),
-            str(response_data.get("satisfaction", "")),
-            response_data.get("role_dislikes", ""),
-            response_data.get("executive_concerns", ""),
-            response_data.get("council_dynamics", ""),
-            response_data.get("student_body_challenges", ""),
-            response_data.get("achievements", ""),
-            response_data.get("weaknesses", ""),
-            response_data.get("skills_needed", ""),
-            response_data.get("constitution_knowledge", ""),
-            ", ".join(response_data.get("support_gaps", [])),
-            response_data.get("support_details", ""),
-            response_data.get("code_of_conduct", ""),
-            response_data.get("financial_challenges", ""),
-            ", ".join(response_data.get("financial_impact", [])),
-            response_data.get("financial_details", ""),
-            response_data.get("academic_challenges", ""),
-            ", ".join(response_data.get("academic_impact", [])),
-            response_data.get("academic_details", ""),
-            ", ".join(response_data.get("support_needs", [])),
-            response_data.get("retreat_goals", ""),
-            response_data.get("training_topics", ""),
-            ", ".join(response_data.get("retreat_priorities", [])),
-            response_data.get("previous_retreats", ""),
-            response_data.get("additional_comments", "")
-        ]
-        
-        body = {'values': [row]}
-        service.spreadsheets().values().append(
-            spreadsheetId=spreadsheet_id,
+        # append finds the end of the table itself, so existing rows are never overwritten
+        body = {'majorDimension': 'ROWS', 'values': rows}
+        request = service.spreadsheets().values().append(
+            spreadsheetId=SPREADSHEET_ID,
             range='Responses!A:AC',
             valueInputOption='RAW',
             insertDataOption='INSERT_ROWS',
+            includeValuesInResponse=False,
             body=body
-        ).execute()
+        )
+        with get_sheets_lock():
+            request.execute()
         
         return True
     except Exception as e:
         st.error(f"Error saving to Google Sheets: {e}")
         return False
 
-def load_from_sheets():
-    """Load all responses from Google Sheets"""
-    if not USE_GOOGLE_SHEETS:
+def fetch_sheet_rows(start_row):
+    """Fetch raw response rows from Google Sheets, starting at the given sheet row"""
+    service = build_sheets_service()
+    request = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f'Responses!A{start_row}:AC',
+        valueRenderOption='UNFORMATTED_VALUE',
+        majorDimension='ROWS'
+    )
+    with get_sheets_lock():
+        result = request.execute()
+    return result.get('values', [])
+
+def fetch_sheet_timestamps():
+    """Fetch just the timestamp column (A) of every response row"""
+    service = build_sheets_service()
+    request = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range='Responses!A2:A',
+        valueRenderOption='UNFORMATTED_VALUE',
+        majorDimension='COLUMNS'
+    )
+    with get_sheets_lock():
+        result = request.execute()
+    values = result.get('values', [])
+    return values[0] if values else []
+
+@st.cache_resource
+def get_sheet_rows():
+    """Raw sheet rows fetched so far, shared by all sessions
+    
+    generation is bumped whenever the rows change, so caches keyed on it
+    never serve results built from older data.
+    """
+    return {"rows": [], "lock": threading.Lock(), "generation": 0}
+
+def rows_to_responses(values):
+    """Convert raw sheet rows to plain tuples in Response field order"""
+    if not values:
         return []
     
+    # Convert to tuples in one pass over a DataFrame
+    df = pd.DataFrame(values).reindex(columns=range(len(FIELDS))).fillna("")
+    df.columns = list(FIELDS)
+    df["satisfaction"] = pd.to_numeric(df["satisfaction"], errors="coerce").fillna(3).astype(int)
+    timestamp_dt = pd.to_datetime(df["timestamp"], errors="coerce", format="ISO8601", cache=True)
+    df["timestamp_dt"] = timestamp_dt.astype(object).where(timestamp_dt.notna(), None)
+    for field in LIST_FIELDS:
+        column = df[field].astype(str)
+        empty = pd.Series([[] for _ in range(len(df))], index=df.index)
+        df[field] = column.str.split(", ", regex=False).mask(column == "", empty)
+    
+    return list(df.itertuples(index=False, name=None))
+
+# cache_resource hands every session the same list, with no per-call copy;
+# callers must not modify it
+@st.cache_resource(ttl=30, show_spinner=False)
+def get_all_responses():
+    """Load all responses, fetching only sheet rows not seen yet (row 1 holds the headers)"""
+    sheet_rows = get_sheet_rows()
+    with sheet_rows["lock"]:
+        rows = sheet_rows["rows"]
+        # Only append new rows if the rows already held are unchanged; a shorter
+        # or different timestamp column means rows were deleted or edited
+        timestamps = fetch_sheet_timestamps()
+        known = [row[0] if row else "" for row in rows]
+        if timestamps[:len(known)] != known:
+            rows.clear()
+            sheet_rows["generation"] += 1
+        new_rows = fetch_sheet_rows(len(rows) + 2)
+        if new_rows:
+            rows.extend(new_rows)
+            sheet_rows["generation"] += 1
+        return (f"sheets-{sheet_rows['generation']}",
+                list(map(Response._make, rows_to_responses(rows))))
+
+def reset_sheet_rows():
+    """Forget all fetched rows so the next load re-reads the whole sheet"""
+    sheet_rows = get_sheet_rows()
+    with sheet_rows["lock"]:
+        sheet_rows["rows"].clear()
+        sheet_rows["generation"] += 1
+    get_all_responses.clear()
+
+def load_from_sheets(refresh=False):
+    """Load all responses from Google Sheets, shared across sessions for 30 seconds
+    
+    Returns (data_version, responses); data_version changes whenever the data does.
+    """
+    if not USE_GOOGLE_SHEETS:
+        return None, []
+    
     try:
-        service = get_sheets_service()
-        if not service:
-            return []
-        
-        spreadsheet_id = st.secrets["spreadsheet_id"]
-        
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range='Responses!A2:AC'
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values:
-            return []
-        
-        # Convert to list of dicts
-        responses = []
-        for row in values:
-            # Pad row to ensure it has all columns
-            while len(row) < 29:
-                row.append("")
-            
-            response = {
-                "timestamp": row[0],
-                "name": row[1],
-                "email": row[2],
-                "position": row[3],
-                "tenure": row[4],
-                "satisfaction": int(row[5]) if row[5] else 3,
-                "role_dislikes": row[6],
-                "executive_concerns": row[7],
-                "council_dynamics": row[8],
-                "student_body_challenges": row[9],
-                "achievements": row[10],
-                "weaknesses": row[11],
-                "skills_needed": row[12],
-                "constitution_knowledge": row[13],
-                "support_gaps": row[14].split(", ") if row[14] else [],
-                "support_details": row[15],
-                "code_of_conduct": row[16],
-                "financial_challenges": row[17],
-                "financial_impact": row[18].split(", ") if row[18] else [],
-                "financial_details": row[19],
-                "academic_challenges": row[20],
-                "academic_impact": row[21].split(", ") if row[21] else [],
-                "academic_details": row[22],
-                "support_needs": row[23].split(", ") if row[23] else [],
-                "retreat_goals": row[24],
-                "training_topics": row[25],
-                "retreat_priorities": row[26].split(", ") if row[26] else [],
-                "previous_retreats": row[27],
-                "additional_comments": row[28]
-            }
-            responses.append(response)
-        
-        return responses
+        if refresh:
+            reset_sheet_rows()
+        return get_all_responses()
     except Exception as e:
         st.error(f"Error loading from Google Sheets: {e}")
-        return []
+        return None, []
+
+def bump_responses_version():
+    """Give this session's in-memory responses a new, process-unique version"""
+    st.session_state.responses_version = f"session-{uuid.uuid4().hex}"
 
 # Initialize session state
 if 'responses' not in st.session_state:
-    if USE_GOOGLE_SHEETS:
-        with st.spinner("Loading responses from Google Sheets..."):
-            st.session_state.responses = load_from_sheets()
-    else:
-        st.session_state.responses = []
+    # Only used without Google Sheets; otherwise all sessions share the cached sheet data
+    st.session_state.responses = []
+    bump_responses_version()
+
+# data_version keys the dashboard and export caches
+if USE_GOOGLE_SHEETS:
+    with st.spinner("Loading responses from Google Sheets..."):
+        data_version, responses = load_from_sheets()
+else:
+    responses = st.session_state.responses
+    data_version = st.session_state.responses_version
 
 if 'admin_logged_in' not in st.session_state:
     st.session_state.admin_logged_in = False
@@ -182,6 +364,434 @@ if 'last_submission_time' not in st.session_state:
 # Admin password
 ADMIN_PASSWORD = st.secrets.get("admin_password", "UTechAdmin2024")
 
+# Balloon animation after a successful submission (off by default, it slows low-end devices)
+ENABLE_BALLOONS = st.secrets.get("enable_balloons", False)
+
+# ============ FORM OPTIONS ============
+POSITIONS = (
+    "",
+    "President",
+    "1st Vice President Academic Affairs",
+    "Vice President, Finance",
+    "Vice President, Student Services",
+    "Vice President, Public Relations",
+    "Executive Secretary",
+    "Faculty of Science and Sport Rep",
+    "College of Health Sciences Rep",
+    "Faculty of Education and Liberal Studies Rep",
+    "School of Engineering Rep",
+    "School of Computing and IT Rep",
+    "School of Business Administration/JDSEEL Rep",
+    "School of Building and Land Management Rep",
+    "Caribbean School of Architecture Rep",
+    "Faculty of Law Rep",
+    "Western Campus Rep",
+    "Resident Students' Rep",
+    "Graduate Students' Rep",
+    "International Students' Rep",
+    "Joint Colleges of Medicine, Oral Health, and Veterinary Sciences Rep",
+    "Director of Elections and Regulatory Affairs",
+    "Director of Community Service",
+    "Director of Health and Safety",
+    "Director of Entertainment and Cultural Activities",
+    "Director of Sport",
+    "Director of Spiritual Development",
+    "Director of Special Projects",
+    "Editor in Chief",
+    "Advisor to the President",
+    "Advisor to the 1st Vice President",
+    "Executive Assistant",
+    "Special Advisor to VP Student Services",
+    "President's Assistant",
+)
+
+TENURE_OPTIONS = (
+    "First year on Council",
+    "Second year on Council",
+    "Third year or more on Council",
+)
+
+SATISFACTION_LABELS = (
+    "Very Dissatisfied",
+    "Dissatisfied",
+    "Neutral",
+    "Satisfied",
+    "Very Satisfied",
+)
+
+CONSTITUTION_KNOWLEDGE_OPTIONS = (
+    "Very limited understanding",
+    "Basic understanding",
+    "Moderate understanding",
+    "Strong understanding",
+    "Expert understanding",
+)
+
+SUPPORT_GAP_OPTIONS = (
+    "Executive Board guidance and mentorship",
+    "Fellow Council members collaboration",
+    "University Administration support",
+    "Financial resources for portfolio activities",
+    "Students' Union Office resources and facilities",
+    "Training and professional development",
+    "Time management and workload balance",
+    "Communication channels and information flow",
+)
+
+YES_NO_OPTIONS = ("Yes", "No")
+
+FINANCIAL_IMPACT_OPTIONS = (
+    "My personal life and well-being",
+    "My ability to fulfill my Council role",
+    "My ability to maintain my academics",
+)
+
+ACADEMIC_IMPACT_OPTIONS = (
+    "My personal stress and well-being",
+    "My ability to fulfill my Council role",
+    "My GPA and academic standing",
+)
+
+SUPPORT_NEEDS_OPTIONS = (
+    "Time management and study skills workshop",
+    "Financial literacy and budgeting resources",
+    "Academic or leadership mentorship",
+    "Access to counseling or wellness services",
+    "More flexible Council meeting schedules",
+)
+
+RETREAT_PRIORITY_OPTIONS = (
+    "Team building and Council unity",
+    "Strategic planning for the year",
+    "Skills training and workshops",
+    "Addressing conflicts and improving communication",
+    "Constitution review and governance",
+    "Improving student engagement strategies",
+    "Council member wellness and self-care",
+)
+
+# ============ FORM SECTIONS ============
+def member_info_section():
+    """Render the Council Member Information section of the assessment form"""
+    st.subheader("Council Member Information")
+    col1, col2 = st.columns(2)
+    with col1:
+        name = st.text_input("Name (Optional)")
+        email = st.text_input("Email (Optional)")
+    with col2:
+        position = st.selectbox("Council Position (Optional)", POSITIONS)
+        tenure = st.selectbox("Time on Council", TENURE_OPTIONS)
+    
+    return {
+        "name": name,
+        "email": email,
+        "position": position,
+        "tenure": tenure
+    }
+
+def council_experience_section():
+    """Render the Council Experience & Effectiveness section of the assessment form"""
+    st.subheader("Council Experience & Effectiveness")
+    satisfaction = st.select_slider(
+        "Overall satisfaction with your Council experience",
+        options=[1, 2, 3, 4, 5],
+        format_func=lambda x: SATISFACTION_LABELS[x-1]
+    )
+    
+    role_dislikes = st.text_area(
+        "What aspects of your Council role do you find most challenging or frustrating?",
+        placeholder="Consider: portfolio responsibilities, time management, resource constraints, communication barriers, etc.",
+        height=150
+    )
+    
+    executive_concerns = st.text_area(
+        "Are there concerns about the Executive Board or Council leadership you'd like to address?",
+        placeholder="This may include decision-making processes, transparency, communication, or guidance received",
+        height=150
+    )
+    
+    council_dynamics = st.text_area(
+        "Describe any challenges in Council dynamics or relationships with fellow Council members",
+        placeholder="Consider: Board interactions, collaboration between portfolios, conflicts, communication issues, etc.",
+        height=150
+    )
+    
+    student_body_challenges = st.text_area(
+        "What challenges do you face in representing or serving the student body?",
+        placeholder="Consider: student engagement, feedback mechanisms, addressing student concerns, etc.",
+        height=150
+    )
+    
+    return {
+        "satisfaction": satisfaction,
+        "role_dislikes": role_dislikes,
+        "executive_concerns": executive_concerns,
+        "council_dynamics": council_dynamics,
+        "student_body_challenges": student_body_challenges
+    }
+
+def leadership_section():
+    """Render the Leadership Development & Portfolio Performance section of the assessment form"""
+    st.subheader("Leadership Development & Portfolio Performance")
+    achievements = st.text_area(
+        "What are your top 3 achievements in your Council role this year?",
+        placeholder="Consider: programs implemented, initiatives led, student impact, collaboration successes, etc.",
+        height=150
+    )
+    
+    weaknesses = st.text_area(
+        "What leadership or portfolio-specific areas do you feel you need to improve?",
+        placeholder="Be honest - this helps us plan targeted training and support",
+        height=150
+    )
+    
+    skills_needed = st.text_area(
+        "What skills, training, or resources would help you serve more effectively?",
+        placeholder="Examples: public speaking, conflict resolution, project management, budgeting, event planning, social media, etc.",
+        height=150
+    )
+    
+    constitution_knowledge = st.selectbox(
+        "How well do you understand the Students' Union Constitution and your role's responsibilities?",
+        CONSTITUTION_KNOWLEDGE_OPTIONS
+    )
+    
+    return {
+        "achievements": achievements,
+        "weaknesses": weaknesses,
+        "skills_needed": skills_needed,
+        "constitution_knowledge": constitution_knowledge
+    }
+
+def support_section():
+    """Render the Support, Resources & Council Operations section of the assessment form"""
+    st.subheader("Support, Resources & Council Operations")
+    support_gaps = st.multiselect(
+        "Select areas where you feel you lack adequate support",
+        SUPPORT_GAP_OPTIONS
+    )
+    
+    support_details = st.text_area(
+        "Please elaborate on any areas where you lack support and suggest improvements",
+        placeholder="Be specific about what would help you succeed in your role",
+        height=150
+    )
+    
+    code_of_conduct = st.text_area(
+        "Have you experienced challenges related to the Council's Code of Conduct or accountability?",
+        placeholder="This includes attendance expectations, report submissions, Council event participation, etc.",
+        height=150
+    )
+    
+    return {
+        "support_gaps": support_gaps,
+        "support_details": support_details,
+        "code_of_conduct": code_of_conduct
+    }
+
+def wellbeing_section():
+    """Render the Financial & Academic Well-being section of the assessment form"""
+    st.subheader("Financial & Academic Well-being")
+    col1, col2 = st.columns(2)
+    
+    financial_impact = []
+    financial_details = ""
+    academic_impact = []
+    academic_details = ""
+    
+    with col1:
+        financial_challenges = st.radio("Are you facing financial challenges?", YES_NO_OPTIONS)
+        if financial_challenges == "Yes":
+            financial_impact = st.multiselect(
+                "These financial challenges affect:",
+                FINANCIAL_IMPACT_OPTIONS
+            )
+            financial_details = st.text_area(
+                "Please elaborate (Optional)",
+                placeholder="Examples: transportation costs, meals during long Council days, tuition challenges, etc.",
+                key="fin_details",
+                height=120
+            )
+    
+    with col2:
+        academic_challenges = st.radio("Are you experiencing academic difficulties?", YES_NO_OPTIONS)
+        if academic_challenges == "Yes":
+            academic_impact = st.multiselect(
+                "These academic difficulties affect:",
+                ACADEMIC_IMPACT_OPTIONS
+            )
+            academic_details = st.text_area(
+                "Please elaborate (Optional)",
+                placeholder="Examples: balancing coursework with Council duties, risk of academic probation, etc.",
+                key="acad_details",
+                height=120
+            )
+    
+    support_needs = st.multiselect(
+        "Would any of these benefit you?",
+        SUPPORT_NEEDS_OPTIONS
+    )
+    
+    return {
+        "financial_challenges": financial_challenges,
+        "financial_impact": financial_impact,
+        "financial_details": financial_details,
+        "academic_challenges": academic_challenges,
+        "academic_impact": academic_impact,
+        "academic_details": academic_details,
+        "support_needs": support_needs
+    }
+
+def retreat_section():
+    """Render the Retreat Expectations & Suggestions section of the assessment form"""
+    st.subheader("Retreat Expectations & Suggestions")
+    retreat_goals = st.text_area(
+        "What do you hope to gain from this mandatory Council retreat?",
+        placeholder="Reference: Constitution Article X, Section 16 - designed for planning, leadership training, and team building",
+        height=150
+    )
+    
+    training_topics = st.text_area(
+        "What specific training topics would benefit you and the Council?",
+        placeholder="Examples: parliamentary procedure, financial management, event planning, conflict resolution, public speaking, etc.",
+        height=150
+    )
+    
+    retreat_priorities = st.multiselect(
+        "Which areas should the retreat prioritize? (Select up to 3)",
+        RETREAT_PRIORITY_OPTIONS
+    )
+    
+    previous_retreats = st.text_area(
+        "If you attended previous retreats, what worked well and what needs improvement?",
+        placeholder="Your feedback helps us make this retreat the best yet",
+        height=150
+    )
+    
+    additional_comments = st.text_area(
+        "Any additional comments, concerns, or suggestions?",
+        placeholder="This is your opportunity to share anything else on your mind",
+        height=150
+    )
+    
+    return {
+        "retreat_goals": retreat_goals,
+        "training_topics": training_topics,
+        "retreat_priorities": retreat_priorities,
+        "previous_retreats": previous_retreats,
+        "additional_comments": additional_comments
+    }
+
+# ============ DASHBOARD HELPERS ============
+# Columns needed for the dashboard metrics and charts
+METRIC_COLS = (
+    "satisfaction", "financial_challenges", "academic_challenges",
+    "support_gaps", "retreat_priorities", "timestamp"
+)
+
+# Arguments starting with an underscore are not hashed by st.cache_data, so
+# these helpers are cached on cache_key alone. Pass data_version as the key:
+# it changes whenever the responses do, so only the most recent few results
+# are kept.
+DASHBOARD_CACHE_ENTRIES = 4
+
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def build_df(cache_key, _responses):
+    """Build the responses DataFrame"""
+    return pd.DataFrame(_responses, columns=Response._fields).drop(columns="timestamp_dt")
+
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def build_metrics_df(cache_key, _responses):
+    """Build a DataFrame with only the columns the dashboard uses"""
+    return pd.DataFrame({col: [getattr(r, col) for r in _responses] for col in METRIC_COLS})
+
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def compute_aggregates(cache_key, _responses):
+    """Compute dashboard metrics and category counts"""
+    df = build_metrics_df(cache_key, _responses)
+    return {
+        "total": len(df),
+        "avg_sat": df['satisfaction'].mean(),
+        "financial_yes": int((df['financial_challenges'] == 'Yes').sum()),
+        "academic_yes": int((df['academic_challenges'] == 'Yes').sum()),
+        "sat_counts": df['satisfaction'].value_counts().sort_index(),
+        "fin_counts": df['financial_challenges'].value_counts(),
+        "acad_counts": df['academic_challenges'].value_counts(),
+        "gap_counts": df['support_gaps'].explode().dropna().value_counts().head(8),
+        "priority_counts": df['retreat_priorities'].explode().dropna().value_counts(),
+    }
+
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def build_figures(cache_key, _agg):
+    """Build dashboard charts, stored as dicts so they can be cached"""
+    sat_counts = _agg["sat_counts"]
+    sat_labels = pd.Categorical.from_codes(sat_counts.index - 1,
+                                           categories=SATISFACTION_LABELS, ordered=True)
+    satisfaction = go.Figure(go.Bar(
+        x=sat_labels,
+        y=sat_counts.values.tolist(),
+        marker_color='#667eea'
+    ))
+    satisfaction.update_layout(xaxis_title='Satisfaction Level', yaxis_title='Count')
+    
+    fin_counts = _agg["fin_counts"]
+    financial = go.Figure(go.Pie(
+        labels=fin_counts.index.tolist(),
+        values=fin_counts.values.tolist(),
+        marker=dict(colors=['#ef4444', '#10b981'])
+    ))
+    
+    acad_counts = _agg["acad_counts"]
+    academic = go.Figure(go.Pie(
+        labels=acad_counts.index.tolist(),
+        values=acad_counts.values.tolist(),
+        marker=dict(colors=['#f59e0b', '#10b981'])
+    ))
+    
+    support_gaps = None
+    gap_counts = _agg["gap_counts"]
+    if not gap_counts.empty:
+        support_gaps = go.Figure(go.Bar(
+            x=gap_counts.values.tolist(),
+            y=gap_counts.index.tolist(),
+            orientation='h',
+            marker=dict(color=gap_counts.values.tolist(), colorscale='Purples')
+        ))
+        support_gaps.update_layout(xaxis_title='Count', yaxis_title='Support Area',
+                                   yaxis={'categoryorder':'total ascending'})
+    
+    priorities = None
+    priority_counts = _agg["priority_counts"]
+    if not priority_counts.empty:
+        priorities = go.Figure(go.Bar(
+            x=priority_counts.values.tolist(),
+            y=priority_counts.index.tolist(),
+            orientation='h',
+            marker=dict(color=priority_counts.values.tolist(), colorscale='Teal')
+        ))
+        priorities.update_layout(xaxis_title='Count', yaxis_title='Priority',
+                                 yaxis={'categoryorder':'total ascending'})
+    
+    figures = {
+        "satisfaction": satisfaction,
+        "financial": financial,
+        "academic": academic,
+        "support_gaps": support_gaps,
+        "priorities": priorities,
+    }
+    return {name: fig.to_dict() if fig else None for name, fig in figures.items()}
+
+# ============ EXPORT HELPERS ============
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def serialize_json(cache_key, _responses):
+    """Serialize responses for the JSON download"""
+    return json.dumps([dict(zip(FIELDS, r)) for r in _responses], indent=2, default=str)
+
+@st.cache_data(show_spinner=False, max_entries=DASHBOARD_CACHE_ENTRIES)
+def serialize_csv(cache_key, _responses):
+    """Serialize responses for the CSV download"""
+    return build_df(cache_key, _responses).to_csv(index=False).encode("utf-8")
+
 # Enhanced Custom CSS
 st.markdown("""
 <style>
@@ -305,7 +915,7 @@ st.markdown("""
 # Show connection status
 if USE_GOOGLE_SHEETS:
     st.sidebar.success("✅ Connected to Google Sheets")
-    st.sidebar.info(f"📊 {len(st.session_state.responses)} responses loaded")
+    st.sidebar.info(f"📊 {len(responses)} responses loaded")
 else:
     st.sidebar.error("⚠️ Google Sheets not configured!")
     st.sidebar.warning("Responses will only be stored in memory and lost on refresh.")
@@ -328,281 +938,51 @@ if page == "📝 Assessment Form":
     st.info("**Confidential:** All responses are anonymous and used solely for planning purposes aligned with Article X, Section 16 of the Students' Union Constitution.")
     
     with st.form("assessment_form"):
-        # Council Member Information
-        st.subheader("Council Member Information")
-        col1, col2 = st.columns(2)
-        with col1:
-            name = st.text_input("Name (Optional)")
-            email = st.text_input("Email (Optional)")
-        with col2:
-            position = st.selectbox("Council Position (Optional)", [
-                "",
-                "President",
-                "1st Vice President Academic Affairs",
-                "Vice President, Finance",
-                "Vice President, Student Services",
-                "Vice President, Public Relations",
-                "Executive Secretary",
-                "Faculty of Science and Sport Rep",
-                "College of Health Sciences Rep",
-                "Faculty of Education and Liberal Studies Rep",
-                "School of Engineering Rep",
-                "School of Computing and IT Rep",
-                "School of Business Administration/JDSEEL Rep",
-                "School of Building and Land Management Rep",
-                "Caribbean School of Architecture Rep",
-                "Faculty of Law Rep",
-                "Western Campus Rep",
-                "Resident Students' Rep",
-                "Graduate Students' Rep",
-                "International Students' Rep",
-                "Joint Colleges of Medicine, Oral Health, and Veterinary Sciences Rep",
-                "Director of Elections and Regulatory Affairs",
-                "Director of Community Service",
-                "Director of Health and Safety",
-                "Director of Entertainment and Cultural Activities",
-                "Director of Sport",
-                "Director of Spiritual Development",
-                "Director of Special Projects",
-                "Editor in Chief",
-                "Advisor to the President",
-                "Advisor to the 1st Vice President",
-                "Executive Assistant",
-                "Special Advisor to VP Student Services",
-                "President's Assistant"
-            ])
-            tenure = st.selectbox("Time on Council", [
-                "First year on Council",
-                "Second year on Council",
-                "Third year or more on Council"
-            ])
-        
-        # Council Experience
-        st.subheader("Council Experience & Effectiveness")
-        satisfaction = st.select_slider(
-            "Overall satisfaction with your Council experience",
-            options=[1, 2, 3, 4, 5],
-            format_func=lambda x: ["Very Dissatisfied", "Dissatisfied", "Neutral", "Satisfied", "Very Satisfied"][x-1]
-        )
-        
-        role_dislikes = st.text_area(
-            "What aspects of your Council role do you find most challenging or frustrating?",
-            placeholder="Consider: portfolio responsibilities, time management, resource constraints, communication barriers, etc.",
-            height=150
-        )
-        
-        executive_concerns = st.text_area(
-            "Are there concerns about the Executive Board or Council leadership you'd like to address?",
-            placeholder="This may include decision-making processes, transparency, communication, or guidance received",
-            height=150
-        )
-        
-        council_dynamics = st.text_area(
-            "Describe any challenges in Council dynamics or relationships with fellow Council members",
-            placeholder="Consider: Board interactions, collaboration between portfolios, conflicts, communication issues, etc.",
-            height=150
-        )
-        
-        student_body_challenges = st.text_area(
-            "What challenges do you face in representing or serving the student body?",
-            placeholder="Consider: student engagement, feedback mechanisms, addressing student concerns, etc.",
-            height=150
-        )
-        
-        # Leadership Development
-        st.subheader("Leadership Development & Portfolio Performance")
-        achievements = st.text_area(
-            "What are your top 3 achievements in your Council role this year?",
-            placeholder="Consider: programs implemented, initiatives led, student impact, collaboration successes, etc.",
-            height=150
-        )
-        
-        weaknesses = st.text_area(
-            "What leadership or portfolio-specific areas do you feel you need to improve?",
-            placeholder="Be honest - this helps us plan targeted training and support",
-            height=150
-        )
-        
-        skills_needed = st.text_area(
-            "What skills, training, or resources would help you serve more effectively?",
-            placeholder="Examples: public speaking, conflict resolution, project management, budgeting, event planning, social media, etc.",
-            height=150
-        )
-        
-        constitution_knowledge = st.selectbox(
-            "How well do you understand the Students' Union Constitution and your role's responsibilities?",
-            ["Very limited understanding", "Basic understanding", "Moderate understanding", 
-             "Strong understanding", "Expert understanding"]
-        )
-        
-        # Support and Resources
-        st.subheader("Support, Resources & Council Operations")
-        support_gaps = st.multiselect(
-            "Select areas where you feel you lack adequate support",
-            ["Executive Board guidance and mentorship",
-             "Fellow Council members collaboration",
-             "University Administration support",
-             "Financial resources for portfolio activities",
-             "Students' Union Office resources and facilities",
-             "Training and professional development",
-             "Time management and workload balance",
-             "Communication channels and information flow"]
-        )
-        
-        support_details = st.text_area(
-            "Please elaborate on any areas where you lack support and suggest improvements",
-            placeholder="Be specific about what would help you succeed in your role",
-            height=150
-        )
-        
-        code_of_conduct = st.text_area(
-            "Have you experienced challenges related to the Council's Code of Conduct or accountability?",
-            placeholder="This includes attendance expectations, report submissions, Council event participation, etc.",
-            height=150
-        )
-        
-        # Financial & Academic Well-being
-        st.subheader("Financial & Academic Well-being")
-        col1, col2 = st.columns(2)
-        
-        financial_impact = []
-        financial_details = ""
-        academic_impact = []
-        academic_details = ""
-        
-        with col1:
-            financial_challenges = st.radio("Are you facing financial challenges?", ["Yes", "No"])
-            if financial_challenges == "Yes":
-                financial_impact = st.multiselect(
-                    "These financial challenges affect:",
-                    ["My personal life and well-being",
-                     "My ability to fulfill my Council role",
-                     "My ability to maintain my academics"]
-                )
-                financial_details = st.text_area(
-                    "Please elaborate (Optional)",
-                    placeholder="Examples: transportation costs, meals during long Council days, tuition challenges, etc.",
-                    key="fin_details",
-                    height=120
-                )
-        
-        with col2:
-            academic_challenges = st.radio("Are you experiencing academic difficulties?", ["Yes", "No"])
-            if academic_challenges == "Yes":
-                academic_impact = st.multiselect(
-                    "These academic difficulties affect:",
-                    ["My personal stress and well-being",
-                     "My ability to fulfill my Council role",
-                     "My GPA and academic standing"]
-                )
-                academic_details = st.text_area(
-                    "Please elaborate (Optional)",
-                    placeholder="Examples: balancing coursework with Council duties, risk of academic probation, etc.",
-                    key="acad_details",
-                    height=120
-                )
-        
-        support_needs = st.multiselect(
-            "Would any of these benefit you?",
-            ["Time management and study skills workshop",
-             "Financial literacy and budgeting resources",
-             "Academic or leadership mentorship",
-             "Access to counseling or wellness services",
-             "More flexible Council meeting schedules"]
-        )
-        
-        # Retreat Expectations
-        st.subheader("Retreat Expectations & Suggestions")
-        retreat_goals = st.text_area(
-            "What do you hope to gain from this mandatory Council retreat?",
-            placeholder="Reference: Constitution Article X, Section 16 - designed for planning, leadership training, and team building",
-            height=150
-        )
-        
-        training_topics = st.text_area(
-            "What specific training topics would benefit you and the Council?",
-            placeholder="Examples: parliamentary procedure, financial management, event planning, conflict resolution, public speaking, etc.",
-            height=150
-        )
-        
-        retreat_priorities = st.multiselect(
-            "Which areas should the retreat prioritize? (Select up to 3)",
-            ["Team building and Council unity",
-             "Strategic planning for the year",
-             "Skills training and workshops",
-             "Addressing conflicts and improving communication",
-             "Constitution review and governance",
-             "Improving student engagement strategies",
-             "Council member wellness and self-care"]
-        )
-        
-        previous_retreats = st.text_area(
-            "If you attended previous retreats, what worked well and what needs improvement?",
-            placeholder="Your feedback helps us make this retreat the best yet",
-            height=150
-        )
-        
-        additional_comments = st.text_area(
-            "Any additional comments, concerns, or suggestions?",
-            placeholder="This is your opportunity to share anything else on your mind",
-            height=150
-        )
+        # Sections render in order; each returns its answers
+        answers = {
+            **member_info_section(),
+            **council_experience_section(),
+            **leadership_section(),
+            **support_section(),
+            **wellbeing_section(),
+            **retreat_section()
+        }
         
         # Submit button
         submitted = st.form_submit_button("Submit Assessment")
         
         if submitted:
+            submitted_at = datetime.now()
             response_data = {
-                "timestamp": datetime.now().isoformat(),
-                "name": name,
-                "email": email,
-                "position": position,
-                "tenure": tenure,
-                "satisfaction": satisfaction,
-                "role_dislikes": role_dislikes,
-                "executive_concerns": executive_concerns,
-                "council_dynamics": council_dynamics,
-                "student_body_challenges": student_body_challenges,
-                "achievements": achievements,
-                "weaknesses": weaknesses,
-                "skills_needed": skills_needed,
-                "constitution_knowledge": constitution_knowledge,
-                "support_gaps": support_gaps,
-                "support_details": support_details,
-                "code_of_conduct": code_of_conduct,
-                "financial_challenges": financial_challenges,
-                "financial_impact": financial_impact,
-                "financial_details": financial_details,
-                "academic_challenges": academic_challenges,
-                "academic_impact": academic_impact,
-                "academic_details": academic_details,
-                "support_needs": support_needs,
-                "retreat_goals": retreat_goals,
-                "training_topics": training_topics,
-                "retreat_priorities": retreat_priorities,
-                "previous_retreats": previous_retreats,
-                "additional_comments": additional_comments
+                "timestamp": submitted_at.isoformat(),
+                **answers
             }
             
-            # Add to session state
-            st.session_state.responses.append(response_data)
-            st.session_state.last_submission_time = datetime.now()
+            st.session_state.last_submission_time = submitted_at
             
             # Try to save to Google Sheets
             if USE_GOOGLE_SHEETS:
                 with st.spinner("Saving your response..."):
-                    if save_to_sheets(response_data):
-                        st.success("✅ Thank you! Your response has been successfully saved to Google Sheets.")
+                    status = save_to_sheets(response_data)
+                if status == "saved":
+                    # Next read refetches from the sheet
+                    get_all_responses.clear()
+                    st.success("✅ Thank you! Your response has been successfully saved to Google Sheets.")
+                    if ENABLE_BALLOONS:
                         st.balloons()
-                    else:
-                        st.error("❌ Failed to save to Google Sheets. Please contact the administrator or try again.")
-                        st.warning("Your response is temporarily stored but may be lost if you refresh the page.")
+                elif status == "queued":
+                    st.success("✅ Thank you! Your response has been received and is queued to be saved to Google Sheets shortly.")
+                else:
+                    st.error("❌ Failed to save to Google Sheets. Please contact the administrator or try again.")
+                    st.warning("Your response was not saved. Please submit it again.")
             else:
+                st.session_state.responses.append(Response(**response_data, timestamp_dt=submitted_at))
+                bump_responses_version()
                 st.warning("⚠️ Response saved temporarily in memory only. It will be lost when you close this page.")
                 st.error("Please contact the administrator to set up Google Sheets for permanent storage.")
-            
-            # Show response count
-            st.info(f"Total responses in this session: {len(st.session_state.responses)}")
+                
+                # Show response count
+                st.info(f"Total responses in this session: {len(responses)}")
 
 # ============ ANALYSIS DASHBOARD PAGE ============
 elif page == "📊 Analysis Dashboard":
@@ -612,42 +992,51 @@ elif page == "📊 Analysis Dashboard":
     if USE_GOOGLE_SHEETS:
         if st.button("🔄 Refresh Data from Google Sheets"):
             with st.spinner("Loading responses..."):
-                st.session_state.responses = load_from_sheets()
-            st.success(f"Loaded {len(st.session_state.responses)} responses!")
+                data_version, responses = load_from_sheets(refresh=True)
+            st.success(f"Loaded {len(responses)} responses!")
             st.rerun()
     
-    if len(st.session_state.responses) == 0:
+    if len(responses) == 0:
         st.warning("No responses yet. Please submit assessments first.")
         
         if not USE_GOOGLE_SHEETS:
             st.error("Google Sheets is not configured. Responses cannot be saved permanently.")
         
-        st.info("You can also upload a JSON file with responses collected previously.")
-        
-        uploaded_file = st.file_uploader("Upload responses JSON file", type=['json'])
-        if uploaded_file is not None:
-            try:
-                data = json.load(uploaded_file)
-                st.session_state.responses = data if isinstance(data, list) else [data]
-                st.success(f"Loaded {len(st.session_state.responses)} responses!")
-                st.rerun()
-            except Exception as e:
-                st.error(f"Error loading file: {e}")
+        if USE_GOOGLE_SHEETS:
+            st.info("Administrators can import responses collected previously from the Admin page.")
+        else:
+            st.info("You can also upload a JSON file with responses collected previously.")
+            
+            uploaded_file = st.file_uploader("Upload responses JSON file", type=['json'])
+            if uploaded_file is not None:
+                try:
+                    data = json.load(uploaded_file)
+                    data = [to_response(r) for r in (data if isinstance(data, list) else [data])]
+                    st.session_state.responses = data
+                    bump_responses_version()
+                    st.success(f"Loaded {len(data)} responses!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Error loading file: {e}")
     else:
-        df = pd.DataFrame(st.session_state.responses)
+        agg = compute_aggregates(data_version, responses)
+        figures = {name: go.Figure(fig) if fig else None
+                   for name, fig in build_figures(data_version, agg).items()}
+        total = agg["total"]
+        avg_sat = agg["avg_sat"]
+        financial_yes = agg["financial_yes"]
+        academic_yes = agg["academic_yes"]
+        priority_counts = agg["priority_counts"]
         
         # Key Metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Responses", len(df))
+            st.metric("Total Responses", total)
         with col2:
-            avg_sat = df['satisfaction'].mean()
             st.metric("Avg Satisfaction", f"{avg_sat:.2f}/5")
         with col3:
-            financial_yes = len(df[df['financial_challenges'] == 'Yes'])
             st.metric("Financial Challenges", financial_yes)
         with col4:
-            academic_yes = len(df[df['academic_challenges'] == 'Yes'])
             st.metric("Academic Challenges", academic_yes)
         
         st.divider()
@@ -657,60 +1046,26 @@ elif page == "📊 Analysis Dashboard":
         
         with col1:
             st.subheader("Overall Satisfaction Distribution")
-            sat_counts = df['satisfaction'].value_counts().sort_index()
-            sat_labels = {1: "Very Dissatisfied", 2: "Dissatisfied", 3: "Neutral", 
-                         4: "Satisfied", 5: "Very Satisfied"}
-            fig = px.bar(x=[sat_labels[i] for i in sat_counts.index], 
-                        y=sat_counts.values,
-                        labels={'x': 'Satisfaction Level', 'y': 'Count'},
-                        color=sat_counts.values,
-                        color_continuous_scale='Blues')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures["satisfaction"], use_container_width=True)
         
         with col2:
             st.subheader("Financial Challenges")
-            fin_counts = df['financial_challenges'].value_counts()
-            fig = px.pie(values=fin_counts.values, names=fin_counts.index,
-                        color_discrete_sequence=['#ef4444', '#10b981'])
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures["financial"], use_container_width=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Academic Challenges")
-            acad_counts = df['academic_challenges'].value_counts()
-            fig = px.pie(values=acad_counts.values, names=acad_counts.index,
-                        color_discrete_sequence=['#f59e0b', '#10b981'])
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures["academic"], use_container_width=True)
         
         with col2:
             st.subheader("Top Support Gaps")
-            all_gaps = []
-            for gaps in df['support_gaps']:
-                if isinstance(gaps, list):
-                    all_gaps.extend(gaps)
-            if all_gaps:
-                gap_counts = pd.Series(all_gaps).value_counts().head(8)
-                fig = px.bar(x=gap_counts.values, y=gap_counts.index, orientation='h',
-                           labels={'x': 'Count', 'y': 'Support Area'},
-                           color=gap_counts.values,
-                           color_continuous_scale='Purples')
-                fig.update_layout(yaxis={'categoryorder':'total ascending'})
-                st.plotly_chart(fig, use_container_width=True)
+            if figures["support_gaps"]:
+                st.plotly_chart(figures["support_gaps"], use_container_width=True)
         
         st.subheader("Retreat Priorities")
-        all_priorities = []
-        for priorities in df['retreat_priorities']:
-            if isinstance(priorities, list):
-                all_priorities.extend(priorities)
-        if all_priorities:
-            priority_counts = pd.Series(all_priorities).value_counts()
-            fig = px.bar(x=priority_counts.values, y=priority_counts.index, orientation='h',
-                       labels={'x': 'Count', 'y': 'Priority'},
-                       color=priority_counts.values,
-                       color_continuous_scale='Teal')
-            fig.update_layout(yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig, use_container_width=True)
+        if figures["priorities"]:
+            st.plotly_chart(figures["priorities"], use_container_width=True)
         
         st.divider()
         st.subheader("🎯 Key Insights & Recommendations")
@@ -718,13 +1073,13 @@ elif page == "📊 Analysis Dashboard":
         if avg_sat < 3:
             st.error("**Low Satisfaction Alert:** Average satisfaction is below 3. Consider prioritizing team morale and addressing concerns in the retreat.")
         
-        if financial_yes > len(df) * 0.3:
+        if financial_yes > total * 0.3:
             st.warning("**Financial Support Needed:** Over 30% of Council members report financial challenges. Consider discussing stipends, transportation support, or flexible scheduling.")
         
-        if academic_yes > len(df) * 0.3:
+        if academic_yes > total * 0.3:
             st.warning("**Academic Balance Concerns:** Significant academic challenges reported. Include time management training and consider lighter Council commitments during exam periods.")
         
-        if all_priorities:
+        if not priority_counts.empty:
             top_3 = priority_counts.head(3)
             st.info(f"**Retreat Focus Areas:** Most requested priorities are: {', '.join(top_3.index)}. Plan retreat sessions accordingly.")
 
@@ -745,18 +1100,105 @@ elif page == "🔐 Admin":
     else:
         st.success("✅ Logged in as Admin")
         
+        # Safety flush of any buffered submissions, unless this rerun comes
+        # from the flush button below, which retries it itself
+        flush_clicked = st.session_state.get("flush_pending_button", False)
+        if USE_GOOGLE_SHEETS and get_pending_rows()["rows"] and not flush_clicked:
+            flush_pending_rows()
+        
         # Sync button
         if USE_GOOGLE_SHEETS:
+            pending_count = len(get_pending_rows()["rows"])
+            if pending_count:
+                st.warning(f"{pending_count} submissions are waiting to be saved to Google Sheets.")
+                if st.button("📤 Flush Pending Submissions", key="flush_pending_button"):
+                    with st.spinner("Saving pending submissions..."):
+                        flushed = flush_pending_rows()
+                    if flushed:
+                        st.rerun()
+            
             if st.button("🔄 Sync with Google Sheets"):
                 with st.spinner("Syncing..."):
-                    st.session_state.responses = load_from_sheets()
-                st.success(f"Synced! {len(st.session_state.responses)} responses loaded")
+                    data_version, responses = load_from_sheets(refresh=True)
+                st.success(f"Synced! {len(responses)} responses loaded")
                 st.rerun()
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total Responses", len(st.session_state.responses))
+            st.metric("Total Responses", len(responses))
         with col2:
-            if st.session_state.responses:
-                latest = datetime.fromisoformat(st.session_state.responses[-1]['timestamp'])
-                st.metric("Latest Response", latest.strftime("%Y-%m
+            if responses:
+                latest = responses[-1].timestamp_dt
+                if latest:
+                    st.metric("Latest Response", latest.strftime("%Y-%m-%d %H:%M"))
+        with col3:
+            if st.button("🚪 Logout"):
+                st.session_state.admin_logged_in = False
+                st.rerun()
+        
+        st.divider()
+        
+        # Import Data (writes to the shared sheet, so admin only)
+        if USE_GOOGLE_SHEETS:
+            st.subheader("📤 Import Responses")
+            st.info("Upload a JSON file of responses collected previously to add them to Google Sheets.")
+            uploaded_file = st.file_uploader("Upload responses JSON file", type=['json'])
+            if uploaded_file is not None and st.button("Import to Google Sheets"):
+                try:
+                    data = json.load(uploaded_file)
+                    data = [to_response(r) for r in (data if isinstance(data, list) else [data])]
+                    with st.spinner("Importing responses to Google Sheets..."):
+                        if bulk_save_to_sheets([response_to_row(r._asdict()) for r in data]):
+                            get_all_responses.clear()
+                            st.success(f"Imported {len(data)} responses!")
+                except Exception as e:
+                    st.error(f"Error loading file: {e}")
+            
+            st.divider()
+        
+        # Download Data
+        st.subheader("📥 Download Data")
+        if responses:
+            json_data = serialize_json(data_version, responses)
+            st.download_button(
+                label="Download as JSON",
+                data=json_data,
+                file_name=f"retreat-responses-{datetime.now().strftime('%Y%m%d')}.json",
+                mime="application/json"
+            )
+            
+            # Also offer CSV download
+            csv = serialize_csv(data_version, responses)
+            st.download_button(
+                label="Download as CSV",
+                data=csv,
+                file_name=f"retreat-responses-{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("No responses to download yet.")
+        
+        st.divider()
+        
+        # View Responses
+        st.subheader("📋 View Responses")
+        if responses:
+            df = build_df(data_version, responses)
+            st.dataframe(df, use_container_width=True)
+        else:
+            st.info("No responses yet.")
+        
+        st.divider()
+        
+        # Clear Data
+        st.subheader("🗑️ Clear All Data")
+        if USE_GOOGLE_SHEETS:
+            st.info("Responses are stored in Google Sheets. Delete rows in the sheet to clear them.")
+        else:
+            st.warning("⚠️ This action cannot be undone!")
+            if st.button("Clear All Responses", type="primary"):
+                if st.checkbox("I understand this will delete all data"):
+                    st.session_state.responses = []
+                    bump_responses_version()
+                    st.success("All responses cleared!")
+                    st.rerun()